@@ -2,23 +2,39 @@
 
 import asyncio
 import logging
+from types import ModuleType
 from typing import Optional
 
+uvloop: Optional[ModuleType]
+try:
+    import uvloop as _uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+else:
+    uvloop = _uvloop
+
 logger = logging.getLogger(__name__)
 
 
 class StormAlertSystem:
     """Real-time storm monitoring and alert system."""
 
+    MAX_ALERT_BATCH = 256
+    DEFAULT_QUEUE_MAX = 10_000
+
     def __init__(self, config: Optional[dict] = None):
         self.config = config or {}
         self._running = False
-        self._alert_queue: asyncio.Queue = asyncio.Queue()
+        self._stop_event = asyncio.Event()
+        self._alert_queue: asyncio.Queue = asyncio.Queue(
+            maxsize=int(self.config.get("queue_max", self.DEFAULT_QUEUE_MAX))
+        )
 
     async def start(self) -> None:
         """Start the alert monitoring system."""
         logger.info("Starting Storm Alert System...")
         self._running = True
+        self._stop_event.clear()
         await asyncio.gather(
             self._monitor_weather_feeds(),
             self._process_alerts(),
@@ -29,6 +45,7 @@ class StormAlertSystem:
         """Gracefully stop the system."""
         logger.info("Stopping Storm Alert System...")
         self._running = False
+        self._stop_event.set()
 
     async def _monitor_weather_feeds(self) -> None:
         """Monitor incoming weather data feeds."""
@@ -38,15 +55,33 @@ class StormAlertSystem:
 
     async def _process_alerts(self) -> None:
         """Process incoming alerts and prioritize them."""
-        while self._running:
-            try:
-                alert = await asyncio.wait_for(
-                    self._alert_queue.get(),
-                    timeout=1.0
+        stop_wait = asyncio.ensure_future(self._stop_event.wait())
+        get_task = asyncio.ensure_future(self._alert_queue.get())
+        try:
+            while True:
+                done, _ = await asyncio.wait(
+                    {get_task, stop_wait},
+                    return_when=asyncio.FIRST_COMPLETED
                 )
-                logger.info(f"Processing alert: {alert}")
-            except asyncio.TimeoutError:
-                continue
+                if get_task in done:
+                    for alert in self._drain_alerts(get_task.result()):
+                        logger.info(f"Processing alert: {alert}")
+                    get_task = asyncio.ensure_future(self._alert_queue.get())
+                if stop_wait in done:
+                    break
+        finally:
+            get_task.cancel()
+            stop_wait.cancel()
+
+    def _drain_alerts(self, first: dict) -> list:
+        """Collect the first alert plus whatever is already queued behind it."""
+        batch = [first]
+        while len(batch) < self.MAX_ALERT_BATCH:
+            try:
+                batch.append(self._alert_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return batch
 
     async def _send_notifications(self) -> None:
         """Send notifications through configured channels."""
@@ -54,9 +89,17 @@ class StormAlertSystem:
             await asyncio.sleep(1)
 
     def add_alert(self, alert: dict) -> None:
-        """Add an alert to the processing queue."""
+        """Add an alert to the processing queue.
+
+        Raises asyncio.QueueFull when the queue is at capacity, so callers
+        that prefer to shed load can drop the alert.
+        """
         self._alert_queue.put_nowait(alert)
 
+    async def add_alert_async(self, alert: dict) -> None:
+        """Add an alert, waiting for room if the queue is at capacity."""
+        await self._alert_queue.put(alert)
+
 
 def create_app(config: Optional[dict] = None) -> StormAlertSystem:
     """Factory function to create system instance."""
@@ -67,8 +110,9 @@ def main() -> None:
     """CLI entry point."""
     logging.basicConfig(level=logging.INFO)
     system = create_app()
+    run = uvloop.run if uvloop is not None else asyncio.run
     try:
-        asyncio.run(system.start())
+        run(system.start())
     except KeyboardInterrupt:
         logger.info("Shutdown requested")
 
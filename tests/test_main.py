@@ -0,0 +1,100 @@
+"""Tests for the storm alert system application."""
+
+import asyncio
+import logging
+
+import pytest
+
+from storm_alert_system.main import create_app
+
+
+@pytest.mark.asyncio
+async def test_process_alerts_returns_promptly_after_stop(sample_config):
+    """Stopping the system ends the alert loop without waiting for a tick."""
+    app = create_app(sample_config)
+    task = asyncio.ensure_future(app._process_alerts())
+    await asyncio.sleep(0)
+
+    await app.stop()
+
+    await asyncio.wait_for(task, timeout=0.1)
+
+
+@pytest.mark.asyncio
+async def test_alerts_queued_before_stop_are_processed(sample_config, caplog):
+    """An alert and a stop completing in the same wakeup are both handled."""
+    caplog.set_level(logging.INFO, logger="storm_alert_system.main")
+    app = create_app(sample_config)
+    app.add_alert({"id": 1})
+    app.add_alert({"id": 2})
+
+    await app.stop()
+    await asyncio.wait_for(app._process_alerts(), timeout=0.1)
+
+    messages = [r.getMessage() for r in caplog.records]
+    assert "Processing alert: {'id': 1}" in messages
+    assert "Processing alert: {'id': 2}" in messages
+    assert app._alert_queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_cancelling_start_leaves_no_pending_tasks(sample_config):
+    """Cancelling start() also cancels the internal get and stop waiters."""
+    app = create_app(sample_config)
+    task = asyncio.ensure_future(app.start())
+    await asyncio.sleep(0.01)
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await asyncio.sleep(0)
+
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+def test_add_alert_raises_queue_full_at_queue_max(sample_config):
+    """The synchronous add path sheds load once the queue is full."""
+    app = create_app({**sample_config, "queue_max": 2})
+    app.add_alert({"id": 1})
+    app.add_alert({"id": 2})
+
+    with pytest.raises(asyncio.QueueFull):
+        app.add_alert({"id": 3})
+
+
+@pytest.mark.asyncio
+async def test_add_alert_async_waits_for_room(sample_config):
+    """The async add path blocks until the consumer drains the queue."""
+    app = create_app({**sample_config, "queue_max": 1})
+    app.add_alert({"id": 1})
+    producer = asyncio.ensure_future(app.add_alert_async({"id": 2}))
+    await asyncio.sleep(0)
+    assert not producer.done()
+
+    app._alert_queue.get_nowait()
+    await asyncio.wait_for(producer, timeout=0.1)
+
+    assert app._alert_queue.get_nowait() == {"id": 2}
+
+
+def test_queue_max_is_coerced_to_int(sample_config):
+    """String limits are coerced and non-numeric limits are rejected."""
+    app = create_app({**sample_config, "queue_max": "5"})
+    assert app._alert_queue.maxsize == 5
+
+    with pytest.raises(TypeError):
+        create_app({**sample_config, "queue_max": None})
+
+
+def test_drain_alerts_caps_batch_in_fifo_order(sample_config):
+    """A drain takes at most MAX_ALERT_BATCH alerts and keeps queue order."""
+    app = create_app(sample_config)
+    total = app.MAX_ALERT_BATCH + 10
+    for i in range(total):
+        app.add_alert({"id": i})
+
+    batch = app._drain_alerts(app._alert_queue.get_nowait())
+
+    assert [alert["id"] for alert in batch] == list(range(app.MAX_ALERT_BATCH))
+    assert app._alert_queue.qsize() == total - app.MAX_ALERT_BATCH
+    assert app._alert_queue.get_nowait() == {"id": app.MAX_ALERT_BATCH}